@@ -4,29 +4,149 @@ import os
 import time
 import zipfile
 import requests
+import asyncio
+import httpx
 import io
 import base64
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from bs4 import BeautifulSoup
+import soupsieve
 from urllib.parse import urljoin, urlparse
 import re
 from collections import deque
 import json
+import functools
+import multiprocessing
+from multiprocessing.util import Finalize
+import shutil
+import subprocess
+import tempfile
+import threading
+
+def _chrome_major_version():
+    # Probe the installed Chrome/Chromium major version, or None if it can't be found
+    for binary in ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']:
+        path = shutil.which(binary)
+        if not path:
+            continue
+        try:
+            output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+            match = re.search(r'(\d+)\.\d+', output)
+            if match:
+                return int(match.group(1))
+        except Exception:
+            continue
+    return None
+
+@functools.lru_cache(maxsize=None)
+def _headless_options():
+    # Pick the headless flag and binary once: (argument, binary_location or None)
+    chrome_version = _chrome_major_version()
+    if chrome_version is not None and chrome_version <= 131:
+        return '--headless=old', None
+
+    # Chrome 132+ dropped old headless from the main binary; it ships as chrome-headless-shell
+    headless_shell = shutil.which('chrome-headless-shell')
+    if headless_shell:
+        return '--headless', headless_shell
+
+    print("⚠ chrome-headless-shell not found, using Chrome's slower new headless mode")
+    return '--headless', None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Asset extensions that are never crawlable pages
+_NON_PAGE_EXT = ('.pdf', '.jpg', '.jpeg', '.png', '.gif', '.css', '.js', '.svg', '.ico', '.webp', '.woff', '.woff2')
+_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+
+# Pages up to this height are captured in one Page.captureScreenshot call (Chrome's limit is 16384px)
+_MAX_CAPTURE_HEIGHT = 16000
+# Taller pages are captured as off-screen CDP tiles of this height
+_CAPTURE_TILE_HEIGHT = 8000
+
+# Chrome cache sizes (shared by all workers when on /dev/shm), and /dev/shm space left for renderers
+_DISK_CACHE_BUDGET = 1073741824
+_MEDIA_CACHE_BUDGET = 268435456
+_SHM_RESERVE = 536870912
+
+# Per-process crawler used by pool workers; each worker owns its own Chrome driver
+_worker_crawler = None
+
+def _init_worker(base_url, max_depth, processes, screenshot_depth, hover_dropdowns, headless_options,
+                 last_hit, host_lock):
+    # Pool initializer: start one Chrome driver per worker and reuse it across tasks
+    global _worker_crawler
+    crawler = GRINWebsiteCrawler(base_url=base_url, max_depth=max_depth, processes=processes,
+                                 screenshot_depth=screenshot_depth,
+                                 hover_dropdowns=hover_dropdowns)
+
+    crawler.headless_options = headless_options
+
+    # Share per-host rate limiting across all workers
+    crawler._last_hit = last_hit
+    crawler._host_lock = host_lock
+
+    # Register cleanup first so a failed setup doesn't leak its temp directories
+    Finalize(None, crawler.close, exitpriority=16)
+
+    _worker_crawler = crawler
+    _ensure_worker_driver()
+
+def _ensure_worker_driver():
+    # (Re)start this worker's driver; never raise, since a raising initializer makes Pool respawn forever
+    if _worker_crawler.driver is not None:
+        return True
+
+    try:
+        _worker_crawler.setup_driver()
+        return True
+    except Exception:
+        _worker_crawler.close()
+        return False
+
+def crawl_page(task):
+    # Crawl a single (url, depth, link_extraction_only) task on this worker's driver
+    url, depth, link_extraction_only = task
+    if not _ensure_worker_driver():
+        # links=None tells crawl_website this worker has no driver
+        print(f"\n{'  ' * depth}  ✗ Error: no Chrome driver for {url}")
+        return url, depth, None, True
+
+    links = _worker_crawler.crawl_page(url, depth, link_extraction_only)
+    failed = url in _worker_crawler.failed_urls
+    return url, depth, links, failed
 
 class GRINWebsiteCrawler:
-    def __init__(self, base_url="https://grin.co", max_depth=3):
+    def __init__(self, base_url="https://grin.co", max_depth=3, processes=8, screenshot_depth=None,
+                 hover_dropdowns=False):
         self.base_url = base_url
         self.max_depth = max_depth
+        self.processes = processes
+        # Pages deeper than this are only visited to discover links
+        self.screenshot_depth = max_depth if screenshot_depth is None else screenshot_depth
+        # Dropdown anchors are already in the static HTML; hovering is only for hover-populated menus
+        self.hover_dropdowns = hover_dropdowns
+
+        # Per-host rate limit: host -> time.monotonic() of its latest scheduled request
+        self._last_hit = {}
+        self._host_lock = threading.Lock()
+        self._min_interval = 1.0
         self.visited_urls = set()
         self.failed_urls = set()
         self.screenshots_dir = "grin_screenshots"
         self.driver = None
-        self.url_queue = deque([(base_url, 0)]) 
+        # Browser profile kept across driver recreations so the HTTP cache survives
+        self.user_data_dir = None
+        self.disk_cache_dir = None
+        # (argument, binary_location) from _headless_options, probed once by the parent for all workers
+        self.headless_options = None
+        self.url_queue = deque([(self.normalize_url(base_url), 0)]) 
+        # Mirrors every URL ever put on url_queue for O(1) dedup
+        self.queued_urls = {self.normalize_url(base_url)}
 
         # Create screenshots directory
         os.makedirs(self.screenshots_dir, exist_ok=True)
@@ -52,12 +172,49 @@ class GRINWebsiteCrawler:
             '.nav-dropdown a'
         ]
 
+        self.content_selectors = [
+            '.main a',
+            '.content a',
+            '.hero a',
+            '.cta a',
+            'main a'
+        ]
+
+        # Compile every link selector once into a single union so each page is walked once
+        self.link_selector_css = ', '.join(self.navigation_selectors + self.dropdown_selectors + self.content_selectors)
+        self.link_selector = soupsieve.compile(self.link_selector_css)
+
+        # Fonts and third-party trackers never matter for the screenshot
+        self.blocked_url_patterns = [
+            '*.woff',
+            '*.woff2',
+            '*.ttf',
+            '*google-analytics.com*',
+            '*googletagmanager.com*',
+            '*facebook.net*',
+            '*doubleclick.net*',
+            '*hotjar.com*',
+            '*segment.io*'
+        ]
+
+        # Link-extraction-only pages don't render anything, so drop images and CSS too
+        self.link_only_blocked_patterns = self.blocked_url_patterns + [
+            '*.jpg',
+            '*.png',
+            '*.gif',
+            '*.css'
+        ]
+
     def setup_driver(self):
         
         chrome_options = Options()
-        chrome_options.add_argument('--headless')
+
+        # Old headless is much faster than the new headless mode for screenshots
+        headless_argument, binary_location = self.headless_options or _headless_options()
+        chrome_options.add_argument(headless_argument)
+        if binary_location:
+            chrome_options.binary_location = binary_location
         chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--disable-extensions')
@@ -66,11 +223,11 @@ class GRINWebsiteCrawler:
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_argument('--disable-web-security')
         chrome_options.add_argument('--allow-running-insecure-content')
-        chrome_options.add_argument('--disable-features=VizDisplayCompositor')
+        chrome_options.add_argument('--disable-features=VizDisplayCompositor,Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints')
         
         
         # Better user agent
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={USER_AGENT}')
         
         # Enable image loading explicitly
         chrome_options.add_argument('--enable-features=NetworkService')
@@ -81,6 +238,28 @@ class GRINWebsiteCrawler:
         # Memory and cache settings for better image loading
         chrome_options.add_argument('--max_old_space_size=8192')
         chrome_options.add_argument('--memory-pressure-off')
+
+        # Persistent profile + large disk cache so shared CSS/JS/fonts are fetched once
+        if self.user_data_dir is None:
+            self.user_data_dir = tempfile.mkdtemp(prefix="grin_crawl_")
+        chrome_options.add_argument(f'--user-data-dir={self.user_data_dir}')
+
+        # One cache per Chrome (it can't be shared)
+        if self.disk_cache_dir is None:
+            # tmpfs is RAM: only use it when the whole budget fits and renderers keep room to spare
+            cache_root = tempfile.gettempdir()
+            try:
+                if shutil.disk_usage('/dev/shm').free >= _DISK_CACHE_BUDGET + _MEDIA_CACHE_BUDGET + _SHM_RESERVE:
+                    cache_root = '/dev/shm'
+            except OSError:
+                pass
+            self.disk_cache_dir = tempfile.mkdtemp(prefix="grin_chrome_cache_", dir=cache_root)
+        chrome_options.add_argument(f'--disk-cache-dir={self.disk_cache_dir}')
+
+        # tmpfs is RAM, so split the budget across workers there; on disk each Chrome gets it all
+        cache_share = self.processes if os.path.dirname(self.disk_cache_dir) == '/dev/shm' else 1
+        chrome_options.add_argument(f'--disk-cache-size={_DISK_CACHE_BUDGET // cache_share}')
+        chrome_options.add_argument(f'--media-cache-size={_MEDIA_CACHE_BUDGET // cache_share}')
         
         # Explicitly allow images and media
         prefs = {
@@ -90,9 +269,25 @@ class GRINWebsiteCrawler:
         }
         chrome_options.add_experimental_option("prefs", prefs)
 
+        # Return from driver.get at DOMContentLoaded; wait_for_complete_page_load handles the rest
+        chrome_options.set_capability('pageLoadStrategy', 'eager')
+
+        # Expose CDP events (Page.lifecycleEvent) through the performance log
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.set_page_load_timeout(120)  
+            self.driver.set_page_load_timeout(30)
+            # Safety cap for trigger_all_lazy_loading's async script
+            self.driver.set_script_timeout(30)
+
+            # Block fonts and trackers at the network layer
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_url_patterns})
+
+            # Report networkIdle/networkAlmostIdle instead of polling for them
+            self.driver.execute_cdp_cmd('Page.enable', {})
+            self.driver.execute_cdp_cmd('Page.setLifecycleEventsEnabled', {'enabled': True})
             
             # Enable full-page screenshots
             self.driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
@@ -110,10 +305,13 @@ class GRINWebsiteCrawler:
     def wait_for_complete_page_load(self):
         # Waiting for complete page load including images
         try:
-            # Step 1: Wait for basic DOM ready with longer timeout
-            WebDriverWait(self.driver, 60).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
+            # Step 1: driver.get returns at DOMContentLoaded (eager), give the load event a bounded wait
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
+            except TimeoutException:
+                pass
 
             # Step 2: Wait for jQuery if present
             try:
@@ -123,270 +321,135 @@ class GRINWebsiteCrawler:
             except:
                 pass
 
-            # Step 3: CRITICAL - Wait for images with better detection
-            self.wait_for_images_to_load()
+            # Step 3: Wait for the navigation's network idle lifecycle event (fires once per load)
+            self.wait_for_network_idle()
 
-            # Step 4: Wait for lazy loading content
+            # Step 4: Trigger lazy loading; the script itself waits for the images it starts
             self.trigger_all_lazy_loading()
 
-            # Step 5: Wait for network idle with longer timeout
-            network_idle_count = 0
-            for i in range(40):  # Check for 20 seconds
-                try:
-                    performance_entries = self.driver.execute_script("""
-                        return window.performance.getEntriesByType('resource')
-                            .filter(entry => entry.responseEnd === 0).length;
-                    """)
-
-                    if performance_entries == 0:
-                        network_idle_count += 1
-                        if network_idle_count >= 5:
-                            break
-                    else:
-                        network_idle_count = 0
+            # Step 5: Wait for fonts and a stable layout height
+            self.wait_for_render_settle()
+        except Exception as e:
+            pass
 
-                    time.sleep(0.5)
-                except:
+    def wait_for_render_settle(self, timeout=2):
+        # Gate on document.fonts.ready, then until the document height stops changing
+        try:
+            WebDriverWait(self.driver, 5).until(
+                lambda driver: driver.execute_script("return document.fonts.ready.then(() => true)")
+            )
+        except Exception:
+            pass
+
+        height_script = "return document.documentElement.getBoundingClientRect().height"
+        deadline = time.monotonic() + timeout
+        try:
+            last_height = self.driver.execute_script(height_script)
+            while time.monotonic() < deadline:
+                time.sleep(0.3)
+                height = self.driver.execute_script(height_script)
+                if height == last_height:
                     break
+                last_height = height
+        except Exception:
+            pass
 
-            # Step 6: Force image loading by scrolling to each image
-            self.force_load_all_images()
+    def wait_for_network_idle(self, timeout=15):
+        # Block on Page.lifecycleEvent networkAlmostIdle/networkIdle for the main frame
+        try:
+            main_frame = self.driver.execute_cdp_cmd('Page.getFrameTree', {})['frameTree']['frame']['id']
+            deadline = time.monotonic() + timeout
 
-            # Step 7: Final wait for any animations
-            time.sleep(8)  
-        except Exception as e:
-            # Fallback longer wait
-            time.sleep(12)
+            while time.monotonic() < deadline:
+                for entry in self.driver.get_log('performance'):
+                    message = json.loads(entry['message'])['message']
+                    if message.get('method') != 'Page.lifecycleEvent':
+                        continue
 
-    def wait_for_images_to_load(self):
-        #Image loading detection with better error handling
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
-                
-                WebDriverWait(self.driver, 30).until(
-                    lambda driver: driver.execute_script("""
-                        var images = Array.from(document.querySelectorAll('img'));
-                        var backgroundImages = Array.from(document.querySelectorAll('*')).filter(function(el) {
-                            var bg = window.getComputedStyle(el).backgroundImage;
-                            return bg && bg !== 'none' && bg.includes('url');
-                        });
-                        
-                        var allImages = images.concat(backgroundImages);
-                        
-                        if (allImages.length === 0) return true;
-                        
-                        var loadedCount = 0;
-                        var errorCount = 0;
-                        
-                        // Check regular images
-                        for (var i = 0; i < images.length; i++) {
-                            var img = images[i];
-                            if (img.complete) {
-                                if (img.naturalHeight > 0) {
-                                    loadedCount++;
-                                } else {
-                                    errorCount++;
-                                }
-                            }
-                        }
-                        
-                        // For background images, assume loaded after DOM complete
-                        loadedCount += backgroundImages.length;
-                        
-                        var totalImages = images.length + backgroundImages.length;
-                        var successfullyLoaded = loadedCount / totalImages;
-                        
-                        return successfullyLoaded >= 0.7; // 70% threshold
-                    """)
-                )
-                break
-                
-            except TimeoutException:
-                if attempt < max_attempts - 1:
-                    time.sleep(5)
-                else:
-                    pass
-            except Exception as e:
-                break
+                    params = message['params']
+                    if params.get('frameId') == main_frame and params.get('name') in ('networkAlmostIdle', 'networkIdle'):
+                        return True
+
+                time.sleep(0.1)
+        except Exception:
+            pass
+
+        return False
 
-    def force_load_all_images(self):
-        # Force load images by scrolling to each one and triggering load events
+    def trigger_all_lazy_loading(self):
+        # One async script: eager-load lazy images, scroll to the bottom, return once images and height settle
         try:
-            # Get all images and scroll to each one
-            self.driver.execute_script("""
-                var images = document.querySelectorAll('img');
-                var loadPromises = [];
-                
-                for (var i = 0; i < images.length; i++) {
-                    var img = images[i];
-                    
-                    // Scroll image into view
-                    img.scrollIntoView({behavior: 'instant', block: 'center'});
-                    
-                    // Force reload if not loaded
-                    if (!img.complete || img.naturalHeight === 0) {
-                        var src = img.src;
-                        img.src = '';
-                        img.src = src;
+            self.driver.execute_async_script("""
+                var done = arguments[arguments.length - 1];
+                var deadline = Date.now() + 25000;
+
+                // Un-lazy every image in a single DOM walk
+                var lazyImages = document.querySelectorAll('img[loading="lazy"], img[data-src], img[data-lazy-src]');
+                lazyImages.forEach(function(img) {
+                    img.loading = 'eager';
+                    var lazySrc = img.dataset.src || img.dataset.lazySrc;
+                    if (lazySrc && img.getAttribute('src') !== lazySrc) {
+                        img.src = lazySrc;
                     }
-                    
-                    // Trigger load event
-                    var event = new Event('load');
-                    img.dispatchEvent(event);
+                });
+
+                function imagesComplete() {
+                    return Array.prototype.every.call(document.images, function(img) {
+                        return img.complete || img.naturalWidth > 0;
+                    });
                 }
-                
-                // Also check for lazy loading attributes and trigger them
-                var lazyImages = document.querySelectorAll('img[data-src], img[data-lazy-src], img[loading="lazy"]');
-                for (var j = 0; j < lazyImages.length; j++) {
-                    var lazyImg = lazyImages[j];
-                    lazyImg.scrollIntoView({behavior: 'instant', block: 'center'});
-                    
-                    // Copy data-src to src if present
-                    if (lazyImg.dataset.src && !lazyImg.src) {
-                        lazyImg.src = lazyImg.dataset.src;
+
+                var step = Math.max(window.innerHeight / 2, 100);
+                var position = 0;
+                var reachedBottom = false;
+                var lastHeight = -1;
+                var stableSince = Date.now();
+
+                var timer = setInterval(function() {
+                    var height = document.body.scrollHeight;
+                    if (height !== lastHeight) {
+                        lastHeight = height;
+                        stableSince = Date.now();
                     }
-                    if (lazyImg.dataset.lazySrc && !lazyImg.src) {
-                        lazyImg.src = lazyImg.dataset.lazySrc;
+
+                    if (Date.now() > deadline) {
+                        clearInterval(timer);
+                        window.scrollTo(0, 0);
+                        done();
+                        return;
                     }
-                }
-            """)
-            
-            time.sleep(5)  
-            
-        except Exception as e:
-            pass
 
-    def trigger_all_lazy_loading(self):
-        # Comprehensive lazy loading trigger
-        try:
-            
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
-            
-            scroll_positions = []
-            for i in range(0, total_height + viewport_height, 150):  
-                scroll_positions.append(min(i, total_height))
-            
-            scroll_positions.extend([0, total_height * 0.25, total_height * 0.5, total_height * 0.75, total_height])
-            scroll_positions = sorted(set(scroll_positions))
-            
-            for position in scroll_positions:
-                self.driver.execute_script(f"window.scrollTo(0, {position});")
-                time.sleep(2)
-                
-                self.driver.execute_script("""
-                    // Trigger intersection observer manually
-                    if (window.IntersectionObserver) {
-                        var images = document.querySelectorAll('img[data-src], img[loading="lazy"]');
-                        images.forEach(function(img) {
-                            var rect = img.getBoundingClientRect();
-                            if (rect.top < window.innerHeight && rect.bottom > 0) {
-                                if (img.dataset.src) {
-                                    img.src = img.dataset.src;
-                                }
-                                img.loading = 'eager';
-                            }
-                        });
+                    // Scroll down until the bottom of the (possibly growing) page is in view
+                    if (!reachedBottom) {
+                        position += step;
+                        window.scrollTo(0, position);
+                        if (position + window.innerHeight >= height) {
+                            reachedBottom = true;
+                            window.scrollTo(0, 0);
+                        }
+                        return;
                     }
-                """)
-                
-                time.sleep(1)
-            
-            # Scroll back to top
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(3)
-            
-        except Exception as e:
-            pass
 
-    def enhanced_lazy_loading_scroll(self):
-        # Enhanced scrolling to trigger all lazy loading content
-        try:
-            # Get initial page height
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            # Multiple scroll passes with different strategies
-            for pass_num in range(3):  # Three passes
-                current_position = 0
-                scroll_step = 100  # Smaller steps for better lazy loading
-                
-                while current_position < last_height:
-                    # Scroll down
-                    self.driver.execute_script(f"window.scrollTo(0, {current_position});")
-                    time.sleep(2)  # Longer wait at each position
-                    
-                    # Force check for lazy images at current viewport
-                    self.driver.execute_script("""
-                        var lazyImages = document.querySelectorAll('img[data-src]:not([src]), img[data-lazy-src]:not([src])');
-                        lazyImages.forEach(function(img) {
-                            var rect = img.getBoundingClientRect();
-                            if (rect.top >= 0 && rect.top <= window.innerHeight) {
-                                if (img.dataset.src) img.src = img.dataset.src;
-                                if (img.dataset.lazySrc) img.src = img.dataset.lazySrc;
-                            }
-                        });
-                    """)
-                    
-                    # Check if new content was loaded
-                    new_height = self.driver.execute_script("return document.body.scrollHeight")
-                    if new_height > last_height:
-                        last_height = new_height
-                    
-                    current_position += scroll_step
-                    
-                    if current_position > 100000:
-                        break
-                
-                time.sleep(3)
-            
-           
-            sections = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-            
-            for section in sections:
-                scroll_to = int(last_height * section)
-                self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
-                time.sleep(3)  
-            
-            # Scroll back to top and wait
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(5)
+                    // Done once all images finished and the height held for 500ms
+                    if (Date.now() - stableSince >= 500 && imagesComplete()) {
+                        clearInterval(timer);
+                        done();
+                    }
+                }, 50);
+            """)
 
         except Exception as e:
             pass
 
-    def safe_hover_trigger(self):
-        # Safely trigger hover effects without causing stale element errors
-        try:
-            hover_selectors = [
-                '.card', '.box', '.item', '.product',
-                'nav li', '.menu-item', '.hero'
-            ]
-
-            for selector in hover_selectors:
-                try:
-                    
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for i, element in enumerate(elements[:5]):  
-                        try:
-                            element.is_displayed()  
-                            webdriver.ActionChains(self.driver).move_to_element(element).perform()
-                            time.sleep(0.5)
-                        except (StaleElementReferenceException, Exception):
-                            continue
-                except Exception:
-                    continue
-
-        except Exception:
-            pass  
-
-    def is_valid_url(self, url):
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def is_valid_url(url):
         # Check if URL is valid and belongs to GRIN domain
         try:
             parsed = urlparse(url)
             return (
                 parsed.netloc in ['grin.co', 'www.grin.co'] and
-                not any(ext in url.lower() for ext in ['.pdf', '.jpg', '.png', '.gif', '.css', '.js']) and
+                not parsed.path.lower().endswith(_NON_PAGE_EXT) and
                 not url.startswith('mailto:') and
                 not url.startswith('tel:') and
                 '#' not in url
@@ -395,68 +458,89 @@ class GRINWebsiteCrawler:
             return False
 
     def extract_navigation_links(self, page_source):
-        # Extract navigation links from page source
-        soup = BeautifulSoup(page_source, 'html.parser')
+        # Extract navigation, dropdown and content links from page source
+        soup = BeautifulSoup(page_source, 'lxml')
+        return self.normalize_links(link.get('href') for link in self.link_selector.iselect(soup))
+
+    def extract_navigation_links_from_dom(self):
+        # Query the same selectors in the live DOM; only the hrefs cross the WebDriver wire
+        hrefs = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]), a => a.getAttribute('href'));",
+            self.link_selector_css
+        )
+        return self.normalize_links(hrefs)
+
+    def normalize_links(self, hrefs):
+        # Resolve raw hrefs against the base URL and keep unique crawlable GRIN pages
         links = set()
 
-        # Extract links from navigation elements
-        for selector in self.navigation_selectors + self.dropdown_selectors:
-            try:
-                nav_links = soup.select(selector)
-                for link in nav_links:
-                    href = link.get('href')
-                    if href:
-                        full_url = urljoin(self.base_url, href)
-                        if self.is_valid_url(full_url):
-                            links.add(full_url)
-            except Exception:
-                continue
-
-        # Also extract from main content areas
-        content_selectors = [
-            '.main a',
-            '.content a',
-            '.hero a',
-            '.cta a',
-            'main a'
-        ]
+        for href in hrefs:
+            if href and not href.startswith('#'):
+                full_url = urljoin(self.base_url, href)
+                if self.is_valid_url(full_url):
+                    links.add(full_url)
 
-        for selector in content_selectors:
+        return list(links)
+
+    async def _prefetch_links_http(self, client, semaphore, url):
+        # Fetch a page over plain HTTP and extract its links; None means it needs Chrome
+        async with semaphore:
+            await self.wait_for_host_slot_async(url)
             try:
-                content_links = soup.select(selector)
-                for link in content_links:
-                    href = link.get('href')
-                    if href and not href.startswith('#'):
-                        full_url = urljoin(self.base_url, href)
-                        if self.is_valid_url(full_url):
-                            links.add(full_url)
-            except Exception:
-                continue
+                response = await client.get(url)
+            except httpx.HTTPError:
+                return url, None
 
-        return list(links)
+        # Blocked or JS-challenged responses fall back to a Chrome render
+        if response.is_error or 'challenge-platform' in response.text:
+            return url, None
+
+        return url, self.extract_navigation_links(response.text)
+
+    async def _prefetch_wave(self, urls):
+        semaphore = asyncio.Semaphore(10)
+        async with httpx.AsyncClient(http2=True, follow_redirects=True, timeout=10,
+                                     headers={'User-Agent': USER_AGENT}) as client:
+            results = await asyncio.gather(*(self._prefetch_links_http(client, semaphore, url) for url in urls))
+        return dict(results)
+
+    def prefetch_links(self, urls):
+        # Extract links from many pages concurrently without a browser
+        if not urls:
+            return {}
+        return asyncio.run(self._prefetch_wave(urls))
 
     def handle_dropdowns_safely(self):
-        # Safely handle dropdown menus without stale element errors
+        # Hover dropdown menus via raw CDP mouse events; no element references, so nothing goes stale
         try:
             nav_selectors = ['nav li', '.nav li', '.menu li', '.navigation li']
-            
-            for selector in nav_selectors:
+
+            # Viewport centers of the first 5 visible items per selector, in one round trip
+            points = self.driver.execute_script("""
+                var seen = new Set();
+                var points = [];
+                arguments[0].forEach(function(selector) {
+                    Array.from(document.querySelectorAll(selector)).slice(0, 5).forEach(function(item) {
+                        var rect = item.getBoundingClientRect();
+                        if (seen.has(item) || rect.width === 0 || rect.height === 0 ||
+                            rect.bottom < 0 || rect.top > window.innerHeight) {
+                            return;
+                        }
+                        seen.add(item);
+                        points.push({x: rect.x + rect.width / 2, y: rect.y + rect.height / 2});
+                    });
+                });
+                return points;
+            """, nav_selectors)
+
+            for point in points:
                 try:
-                    
-                    nav_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    for i in range(min(len(nav_items), 5)):  
-                        try:
-                            
-                            nav_items = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                            if i < len(nav_items):
-                                item = nav_items[i]
-                                
-                                item.is_displayed()
-                                webdriver.ActionChains(self.driver).move_to_element(item).perform()
-                                time.sleep(1.5)
-                        except (StaleElementReferenceException, Exception):
-                            continue
+                    self.driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+                        'type': 'mouseMoved',
+                        'x': point['x'],
+                        'y': point['y']
+                    })
+                    time.sleep(1.5)
                 except Exception:
                     continue
 
@@ -470,105 +554,104 @@ class GRINWebsiteCrawler:
 
             # Ensure all content is loaded before screenshot
             self.wait_for_complete_page_load()
-            
-            time.sleep(5)
 
-            # Method 1: Chrome DevTools Protocol (preferred for full page)
-            try:
-                page_rect = self.driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
-                content_size = page_rect['contentSize']
-
-                screenshot_data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
-                    'format': 'png',
-                    'captureBeyondViewport': True,
-                    'clip': {
-                        'x': 0,
-                        'y': 0,
-                        'width': content_size['width'],
-                        'height': content_size['height'],
-                        'scale': 1
-                    }
-                })
+            # Chrome DevTools Protocol renders the full page in one pass
+            page_rect = self.driver.execute_cdp_cmd('Page.getLayoutMetrics', {})
+            content_size = page_rect['contentSize']
+            width = int(content_size['width'])
+            height = int(content_size['height'])
 
-                screenshot_path = os.path.join(self.screenshots_dir, filename)
-                with open(screenshot_path, 'wb') as f:
-                    f.write(base64.b64decode(screenshot_data['data']))
-
-                print(f"    ✓ Screenshot saved: {filename}")
-                return True
+            screenshot_path = os.path.join(self.screenshots_dir, filename)
 
-            except Exception as e:
-                # Method 2: Manual stitching with PIL
-                try:
-                    from PIL import Image
-
-                    total_height = self.driver.execute_script("""
-                        return Math.max(
-                            document.body.scrollHeight,
-                            document.body.offsetHeight,
-                            document.documentElement.clientHeight,
-                            document.documentElement.scrollHeight,
-                            document.documentElement.offsetHeight
-                        );
-                    """)
-
-                    viewport_height = 1080
-                    self.driver.set_window_size(1920, viewport_height)
-                    time.sleep(3)
-
-                    screenshots = []
-                    overlap = 100
-
-                    for y in range(0, total_height, viewport_height - overlap):
-                        self.driver.execute_script(f"window.scrollTo(0, {y});")
-                        time.sleep(4)  
-
-                        screenshot_png = self.driver.get_screenshot_as_png()
-                        screenshot_img = Image.open(io.BytesIO(screenshot_png))
-                        screenshots.append((screenshot_img, y))
-
-                    if screenshots:
-                        full_image = Image.new('RGB', (screenshots[0][0].size[0], total_height), (255, 255, 255))
-
-                        for img, y_pos in screenshots:
-                            paste_y = min(y_pos, total_height - img.size[1])
-                            full_image.paste(img, (0, paste_y))
-
-                        screenshot_path = os.path.join(self.screenshots_dir, filename)
-                        full_image.save(screenshot_path, 'PNG', quality=95)
-                        print(f"    ✓ Stitched screenshot saved: {filename}")
-                        return True
+            if height <= _MAX_CAPTURE_HEIGHT:
+                with open(screenshot_path, 'wb') as f:
+                    f.write(self.capture_region(0, width, height))
+            else:
+                self.save_stitched_screenshot(screenshot_path, width, height)
 
-                except Exception as e2:
-                    total_height = self.driver.execute_script("return document.body.scrollHeight;")
-                    max_height = min(total_height, 20000)  
-                    
-                    self.driver.set_window_size(1920, max_height)
-                    time.sleep(6)
-                    
-                    screenshot_path = os.path.join(self.screenshots_dir, filename)
-                    self.driver.save_screenshot(screenshot_path)
-                    print(f"    ✓ Fallback screenshot saved: {filename}")
-                    return True
+            print(f"    ✓ Screenshot saved: {filename}")
+            return True
 
         except Exception as e:
             return False
 
-    def sanitize_filename(self, url):
+    def capture_region(self, y, width, height):
+        # Capture a clip of the page as PNG bytes without scrolling
+        screenshot_data = self.driver.execute_cdp_cmd('Page.captureScreenshot', {
+            'format': 'png',
+            'captureBeyondViewport': True,
+            'clip': {
+                'x': 0,
+                'y': y,
+                'width': width,
+                'height': height,
+                'scale': 1
+            }
+        })
+        return base64.b64decode(screenshot_data['data'])
+
+    def save_stitched_screenshot(self, screenshot_path, width, height):
+        # Pages taller than Chrome's capture limit are captured as tiles and pasted once
+        from PIL import Image
+
+        full_image = Image.new('RGB', (width, height), (255, 255, 255))
+
+        for y in range(0, height, _CAPTURE_TILE_HEIGHT):
+            tile_height = min(_CAPTURE_TILE_HEIGHT, height - y)
+            tile = Image.open(io.BytesIO(self.capture_region(y, width, tile_height)))
+            full_image.paste(tile, (0, y))
+
+        full_image.save(screenshot_path, 'PNG', optimize=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def normalize_url(url):
+        # Treat the bare host and its root path as one page (e.g. https://grin.co and https://grin.co/)
+        parsed = urlparse(url)
+        if not parsed.path:
+            return parsed._replace(path='/').geturl()
+        return url
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def sanitize_filename(url):
         # Create a safe filename from URL
         path = urlparse(url).path
         if not path or path == '/':
             return "homepage.png"
 
         filename = path.strip('/').replace('/', '_')
-        filename = re.sub(r'[^\w\-_.]', '_', filename)
+        filename = _SANITIZE_RE.sub('_', filename)
 
         if not filename.endswith('.png'):
             filename += '.png'
 
         return filename
 
-    def crawl_page(self, url, depth):
+    def reserve_host_slot(self, url):
+        # Claim the next request slot for url's host, at least _min_interval after the last; returns the wait
+        host = urlparse(url).netloc
+
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._last_hit.get(host, 0) + self._min_interval)
+            self._last_hit[host] = slot
+
+        return slot - now
+
+    def wait_for_host_slot(self, url):
+        # Respectful delay for the Chrome path
+        delay = self.reserve_host_slot(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_for_host_slot_async(self, url):
+        # Same per-host slots for the HTTP prefetch path, without blocking the event loop
+        delay = self.reserve_host_slot(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def crawl_page(self, url, depth, link_extraction_only=False):
         # Crawl a single page with enhanced loading
         if url in self.visited_urls or depth > self.max_depth:
             return []
@@ -576,23 +659,36 @@ class GRINWebsiteCrawler:
         print(f"\n{'  ' * depth}🔍 Crawling: {url} (depth: {depth})")
 
         try:
+            # The driver is reused across pages, so reset the block list every time
+            blocked = self.link_only_blocked_patterns if link_extraction_only else self.blocked_url_patterns
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked})
+
+            self.wait_for_host_slot(url)
+
+            # Drain stale lifecycle events so wait_for_network_idle only sees this navigation
+            self.driver.get_log('performance')
+
             self.driver.get(url)
             self.visited_urls.add(url)
 
-            self.handle_dropdowns_safely()
+            if not link_extraction_only:
+                if self.hover_dropdowns:
+                    self.handle_dropdowns_safely()
 
-            # Take enhanced screenshot
-            filename = self.sanitize_filename(url)
-            success = self.take_enhanced_screenshot(url, filename)
+                # Take enhanced screenshot
+                filename = self.sanitize_filename(url)
+                success = self.take_enhanced_screenshot(url, filename)
 
-            if success:
-                print(f"{'  ' * depth}    ✅ Screenshot captured")
+                if success:
+                    print(f"{'  ' * depth}    ✅ Screenshot captured")
+                else:
+                    print(f"{'  ' * depth}    ⚠ Screenshot had issues")
             else:
-                print(f"{'  ' * depth}    ⚠ Screenshot had issues")
+                # driver.get returns at DOMContentLoaded (eager); let script-built navs render first
+                self.wait_for_network_idle()
 
             # Extract links
-            page_source = self.driver.page_source
-            links = self.extract_navigation_links(page_source)
+            links = self.extract_navigation_links_from_dom()
             new_links = [link for link in links if link not in self.visited_urls]
             
             print(f"{'  ' * depth}    📋 Found {len(new_links)} new links")
@@ -619,39 +715,108 @@ class GRINWebsiteCrawler:
             "https://grin.co/product/influencer-marketing-reporting-platform/",
         ]
 
-        for page in important_pages:
-            if page not in [item[0] for item in self.url_queue]:
-                self.url_queue.append((page, 0))
+        self.enqueue_links(important_pages, 0)
 
-        while self.url_queue:
-            url, depth = self.url_queue.popleft()
+        # HTTP prefetches here and Chrome workers share one per-host rate limit
+        manager = multiprocessing.Manager()
+        self._last_hit = manager.dict()
+        self._host_lock = manager.Lock()
 
-            if url in self.visited_urls or depth > self.max_depth:
-                continue
+        try:
+            self.crawl_with_pool(important_pages)
+        finally:
+            manager.shutdown()
 
-            new_links = self.crawl_page(url, depth)
+    def crawl_with_pool(self, important_pages):
+        # Populate the frontier over plain HTTP before the Chrome screenshot phase
+        for links in self.prefetch_links(important_pages).values():
+            self.enqueue_links(links or [], 1)
 
-            for link in new_links:
-                if link not in self.visited_urls:
-                    self.url_queue.append((link, depth + 1))
+        pool = multiprocessing.Pool(
+            processes=self.processes,
+            initializer=_init_worker,
+            initargs=(self.base_url, self.max_depth, self.processes, self.screenshot_depth, self.hover_dropdowns,
+                      _headless_options(), self._last_hit, self._host_lock),
+        )
+
+        try:
+            while self.url_queue:
+                # Drain everything queued so far into one wave
+                wave = []
+                wave_filenames = set()
+                while self.url_queue:
+                    url, depth = self.url_queue.popleft()
+
+                    if url in self.visited_urls or depth > self.max_depth:
+                        continue
+
+                    # Workers run concurrently, so two pages in a wave must never write the same file
+                    link_only = depth > self.screenshot_depth
+                    if not link_only:
+                        filename = self.sanitize_filename(url)
+                        if filename in wave_filenames:
+                            continue
+                        wave_filenames.add(filename)
+
+                    self.visited_urls.add(url)
+                    wave.append((url, depth, link_only))
+
+                # Link-only pages go over HTTP; only failures there need Chrome
+                prefetched = self.prefetch_links([url for url, depth, link_only in wave if link_only])
+                chrome_wave = []
+                for url, depth, link_only in wave:
+                    links = prefetched.get(url)
+                    if links is None:
+                        chrome_wave.append((url, depth, link_only))
+                    else:
+                        print(f"\n{'  ' * depth}🌐 Fetched: {url} (depth: {depth}), {len(links)} links")
+                        self.enqueue_links(links, depth + 1)
 
-            # Respectful delay
-            time.sleep(4)
+                without_driver = 0
+                for url, depth, new_links, failed in pool.imap_unordered(crawl_page, chrome_wave):
+                    if failed:
+                        self.failed_urls.add(url)
+
+                    if new_links is None:
+                        without_driver += 1
+                        continue
+
+                    self.enqueue_links(new_links, depth + 1)
+
+                # Every worker failed to start Chrome: stop instead of failing each page quietly
+                if chrome_wave and without_driver == len(chrome_wave):
+                    raise RuntimeError("no Chrome driver could be started in any worker")
+
+        finally:
+            # close/join (not terminate) so each worker's Finalize quits its driver
+            pool.close()
+            pool.join()
+
+    def enqueue_links(self, links, depth):
+        # Queue links not yet visited or queued at the given depth
+        for link in links:
+            link = self.normalize_url(link)
+            if link not in self.visited_urls and link not in self.queued_urls:
+                self.url_queue.append((link, depth))
+                self.queued_urls.add(link)
 
     def create_zip_file(self):
         # Create zip file with all screenshots
         zip_filename = "grin_website_screenshots.zip"
 
         try:
-            with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            count = 0
+            # PNGs are already deflate-compressed, so store them as-is
+            with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_STORED, allowZip64=True) as zipf:
                 for root, dirs, files in os.walk(self.screenshots_dir):
                     for file in files:
                         if file.endswith('.png'):
                             file_path = os.path.join(root, file)
-                            zipf.write(file_path, file)
+                            zipf.write(file_path, file, compress_type=zipfile.ZIP_STORED)
+                            count += 1
 
             print(f"\n✓ Created zip file: {zip_filename}")
-            print(f"  Total screenshots: {len(os.listdir(self.screenshots_dir))}")
+            print(f"  Total screenshots: {count}")
             return zip_filename
 
         except Exception as e:
@@ -661,7 +826,6 @@ class GRINWebsiteCrawler:
     def run(self):
         # Main execution method
         try:
-            self.setup_driver()
             self.crawl_website()
 
             print(f"\n📊 Crawl Summary:")
@@ -678,9 +842,22 @@ class GRINWebsiteCrawler:
             print(f"✗ Critical error: {e}")
 
         finally:
-            if self.driver:
-                self.driver.quit()
-                print("✓ Browser closed")
+            self.close()
+
+    def close(self):
+        # Quit the driver and remove the browser profile and cache created for this run
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+            print("✓ Browser closed")
+
+        if self.user_data_dir:
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
+            self.user_data_dir = None
+
+        if self.disk_cache_dir:
+            shutil.rmtree(self.disk_cache_dir, ignore_errors=True)
+            self.disk_cache_dir = None
 
 # Main execution
 if __name__ == "__main__":
@@ -699,7 +876,7 @@ if __name__ == "__main__":
     else:
         print("\n Task failed - no zip file created")
 
-def run_custom_crawl(base_url="https://grin.co", max_depth=2):
+def run_custom_crawl(base_url="https://grin.co", max_depth=2, screenshot_depth=None):
     """Run crawler with custom parameters"""
-    crawler = GRINWebsiteCrawler(base_url=base_url, max_depth=max_depth)
+    crawler = GRINWebsiteCrawler(base_url=base_url, max_depth=max_depth, screenshot_depth=screenshot_depth)
     return crawler.run()
\ No newline at end of file